@@ -1,34 +1,76 @@
 """This module is a MOO2 saved game reader and editor."""
 
-import array, mmap, itertools, random
+import mmap, itertools, random, struct
 
 # The offsets into the saved game file.
 starblock_offset, planetblock_offset = 0x17ad3, 0x162e9
+# A little endian short, and the five planet numbers indexed by a star.
+_U16, _PLANET_SLOTS = struct.Struct('<H'), struct.Struct('<5H')
+# The planet block through byte 0xd: the colony number, then byte fields.
+_PLANET_FIELDS = struct.Struct('<H12B')
+
+def _reverse(table):
+    """Map the values of a list or dictionary back to their keys."""
+    items = table.items() if isinstance(table, dict) else enumerate(table)
+    return dict((v,k) for k,v in items)
+
+def _hash32(x):
+    """A well mixed 32-bit hash of an integer, with the murmur3 finalizer."""
+    x = (x * 0x9e3779b9) & 0xffffffff
+    x ^= x >> 16
+    x = (x * 0x85ebca6b) & 0xffffffff
+    x ^= x >> 13
+    x = (x * 0xc2b2ae35) & 0xffffffff
+    return x ^ (x >> 16)
+
+def _compute_maxplanet(data):
+    """The highest planet number indexed by any star, or -1 if none are."""
+    maxplanet = -1
+    for o in Star._OFFSETS:
+        # Stars are contiguous, so the first non-existant one ends them.
+        if not data[o]: break
+        for n in _PLANET_SLOTS.unpack_from(data, o+Star.planet_offset):
+            if n != 0xffff and n > maxplanet: maxplanet = n
+    return maxplanet
 
 class Game(object):
     def __init__(self, path):
         """Construct a game given a path to a saved game file."""
         self.path = path
-        # Read in the file at the given path.
+        # Map in the file at the given path.  The mapping is copy on
+        # write, so edits are private to this game until it is saved.
         f = open(path, 'rb')
-        self.data = array.array('B', f.read())
+        self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
         f.close()
+        # Stars, planets, etc. already constructed, keyed by type and number.
+        self._objects = {}
         # Find higher number planet.
-        self.maxplanet=max(p.number for s in self.stars() for p in s.planets())
+        self.maxplanet = _compute_maxplanet(self.data)
 
     def save(self, path=None):
         """Save to the given path, or the original path if no path is given."""
         filepath = path if path else self.path
+        # The mapping is copy on write, so flushing it would not reach
+        # the file.  Copy the data out before opening, as the path may
+        # name the mapped file, and truncating it would invalidate pages
+        # of the mapping that have not been read yet.
+        data = self.data[:]
         f = open(filepath, 'wb')
-        strdata = ''.join(chr(i) for i in self.data)
-        f.write(strdata)
+        f.write(data)
         f.close()
 
+    def stars_list(self):
+        """List of the stars in the game."""
+        stars = []
+        for i, o in enumerate(Star._OFFSETS):
+            # Check the star exists before getting it, as Star.exists does.
+            if not self.data[o]: break
+            stars.append(Star.get(self, i))
+        return stars
+
     def stars(self):
-        for i in xrange(Star.max_stars):
-            star = Star(self, i)
-            if not star.exists: break
-            yield star
+        """Iterator over the stars in the game."""
+        return iter(self.stars_list())
 
     def star(self, name):
         """Return a star with a specified name, None if it doesn't exist."""
@@ -42,32 +84,64 @@ class Game(object):
     numplayers = property(_getnumplayers)
 
     def players(self):
-        for i in xrange(self.numplayers):
-            yield Player(self, i)
+        for i in range(self.numplayers):
+            yield Player.get(self, i)
 
     def short_at_offset(self, o):
-        return self.data[o] + (self.data[o+1]<<8)
+        return _U16.unpack_from(self.data, o)[0]
     def set_short_at_offset(self, o, value):
-        self.data[o+1] = value>>8
-        self.data[o] = value&0xff
+        _U16.pack_into(self.data, o, value)
+
+    def string_at_offset(self, o, size):
+        """The null terminated string of at most size bytes at an offset."""
+        return self.data[o:o+size].split(b'\0', 1)[0].decode('latin-1')
 
 class DataOffsetType(object):
+    __slots__ = ()
+
+    @classmethod
+    def get(cls, game, number):
+        """The object with the given number in the game.
+
+        This is constructed on first request, and the same object is
+        returned on subsequent requests."""
+        key = (cls, number)
+        obj = game._objects.get(key)
+        if obj is None:
+            obj = game._objects[key] = cls(game, number)
+        return obj
+
+    def _getblock(self):
+        """A copy of the bytes of the data block."""
+        return self.game.data[self.offset:self.offset+self.block_size]
+    block = property(_getblock, None, None, _getblock.__doc__)
+
     def _getblock_str(self):
-        """A string representation of the data block of this planet."""
-        return ' '.join('%02X' % b for b in self.game.data[
-            self.offset:self.offset+self.block_size])
+        """A string representation of the data block, in hex bytes."""
+        # Format through a view of the data, rather than copying the
+        # block.  Release the views at once, as the mapping cannot be
+        # closed or resized while they are alive.
+        with memoryview(self.game.data) as view:
+            with view[self.offset:self.offset+self.block_size] as block:
+                return block.hex(' ').upper()
     block_str = property(_getblock_str, None, None, _getblock_str.__doc__)
 
 class Star(DataOffsetType):
     """Encapsulation of the data for a given star."""
+    __slots__ = ('game', 'offset', 'number', '_slot_offsets')
     # The amount of the offset into the file where the stars start to appear.
     block_offset = 0x17ad3
     # The maximum number of stars that a saved game file can support.
     max_stars = 72
     # The number of bytes for each star.
     block_size = 0x71
+    # The offset of each star's block in the file.
+    _OFFSETS = tuple(range(block_offset, block_offset+max_stars*block_size,
+                           block_size))
     # The offset into the star block where the planets are indexed.
     planet_offset = 0x4a
+    # The name occupies the start of the block, up to the x-coordinate.
+    name_size = 15
 
     # Star color indices.
     star_color = ['blue', 'white', 'yellow', 'orange', 'red']
@@ -77,9 +151,12 @@ class Star(DataOffsetType):
         if number < 0 or number >= Star.max_stars:
             raise ValueError("star number must be in range 0 to %d"%(
                 Star.max_stars-1))
-        self.offset = Star.block_offset + number*Star.block_size
+        self.offset = Star._OFFSETS[number]
         self.number = number
         self.game = game
+        # The offsets of the planet numbers for each orbital position.
+        self._slot_offsets = tuple(
+            self.offset+Star.planet_offset+2*pos for pos in range(5))
 
     def _getexists(self):
         """True if the given star exists in the game."""
@@ -88,10 +165,7 @@ class Star(DataOffsetType):
 
     def _getname(self):
         """The name of the star."""
-        end = self.offset
-        d = self.game.data
-        while d[end]: end+=1
-        return ''.join(chr(c) for c in d[self.offset:end])
+        return self.game.string_at_offset(self.offset, Star.name_size)
     name = property(_getname, None, None, _getname.__doc__)
 
     # X AND Y COORDINATES ON THE STAR MAP
@@ -120,25 +194,26 @@ class Star(DataOffsetType):
         """A string representation of this star."""
         return '<star 0x%02X %s>'%(self.number,self.name)
 
-    # The data block.
+    def _planet_nums(self):
+        """The planet numbers in the five slots, 0xffff where empty."""
+        return _PLANET_SLOTS.unpack_from(self.game.data, self._slot_offsets[0])
 
-    def _getblock(self):
-        return self.game.data[self.offset:self.offset+Star.block_size]
-    block = property(_getblock, None, None, _getblock.__doc__)
+    def planets_list(self):
+        """List of the planets in the star system."""
+        return [Planet.get(self.game, n) for n in self._planet_nums()
+                if n != 0xffff]
 
-    def _getblock_str(self):
-        """A string representation of the data block of this star."""
-        return ' '.join('%02X'%b for b in self.game.data[
-            self.offset:self.offset+Star.block_size])
-    block_str = property(_getblock_str, None, None, _getblock_str.__doc__)
+    def occupied_positions(self):
+        """Bitmask of the orbital positions that have a planet.
+
+        Bit k is set if position k is filled in this star's planet
+        slots, which is what make_planet checks and writes."""
+        return sum(1 << pos for pos, n in enumerate(self._planet_nums())
+                   if n != 0xffff)
 
     def planets(self):
         """Iterator over the planets in the star system."""
-        d = self.game.data
-        for i in xrange(self.planet_offset, self.planet_offset+10, 2):
-            planet_num = self.game.short_at_offset(self.offset+i)
-            if planet_num == 0xffff: continue
-            yield Planet(self.game, planet_num)
+        return iter(self.planets_list())
 
     def planet_at(self, pos):
         """The planet at orbital position 0 through 4.
@@ -146,9 +221,9 @@ class Star(DataOffsetType):
         This returns None if there is no planet at that position"""
         if not 0<=pos<=4:
             raise IndexError("planets indexed 0 through 4")
-        planet_num = self.game.short_at_offset(
-            self.offset+self.planet_offset+2*pos)
-        return None if planet_num == 0xffff else Planet(self.game, planet_num)
+        planet_num = self.game.short_at_offset(self._slot_offsets[pos])
+        return None if planet_num == 0xffff else Planet.get(
+            self.game, planet_num)
 
     def make_planet(self, pos, btype=3):
         """Makes a new planet at the indicated position.
@@ -161,36 +236,56 @@ class Star(DataOffsetType):
         construction (large, abundant, normal-G, barren).  If a planet
         exists there, an exception will be raised.  This function
         returns the constructed planet."""
-        if self.planet_at(pos) != None:
+        if self.planet_at(pos) is not None:
             raise ValueError("planet already exists at position %d" % pos)
+        return self._make_planet_unchecked(pos, btype)
+
+    def _make_planet_unchecked(self, pos, btype=3):
+        """Makes a new planet at a position already known to be empty.
+
+        This is make_planet without the check for an existing planet.
+        If the position is in fact occupied, its planet is overwritten in
+        the star and orphaned, so callers must have checked the star's
+        slots, for example with occupied_positions."""
+        if not 0<=pos<=4:
+            raise IndexError("planets indexed 0 through 4")
         if not 1<=btype<=3:
             raise ValueError("type must be 1 through 3")
         self.game.maxplanet += 1
-        newp = Planet(self.game, self.game.maxplanet)
-        newdata = array.array('B', [0]*Planet.block_size)
-        # No colony yet, set this to 0xffff.
-        newdata[0] = newdata[1] = 0xff
-        # Star system number and position, and that this is a planet.
-        newdata[2], newdata[3], newdata[4] = self.number, pos, btype
-        # A large, medium gravity barren world.
-        newdata[5], newdata[6], newdata[8] = 3, 1, 2
-        # Unpredictably (to the user) but deterministically assign scenery.
-        newdata[9] = random.Random(pos + btype*5 + self.number*15).randrange(3)
-        # Abundant world, assign "7" for large.
-        newdata[0xa], newdata[0xd] = 2, Planet.size2blockd[newdata[5]]
+        newp = Planet.get(self.game, self.game.maxplanet)
+        # Unpredictably (to the user) but deterministically assign
+        # scenery, scaling a hash of the position and type into 0 to 2.
+        scenery = (_hash32(pos + btype*5 + self.number*15) * 3) >> 32
+        newdata = bytearray(Planet.block_size)
+        _PLANET_FIELDS.pack_into(
+            newdata, 0,
+            # No colony yet, set this to 0xffff.
+            0xffff,
+            # Star system number and position, and that this is a planet.
+            self.number, pos, btype,
+            # A large, medium gravity barren world.  The unknown byte 7
+            # is always 0 on constructed planets.
+            3, 1, 0, 2,
+            # The scenery, then an abundant world with no food.
+            scenery, 2, 0,
+            # Never terraformed, and assign "7" for large.
+            0, Planet.size2blockd[3])
         # Put in the planet data.
         self.game.data[newp.offset : newp.offset+Planet.block_size] = newdata
         # Point the star to the appropriate planet data.
-        self.game.set_short_at_offset(
-            self.offset+self.planet_offset+2*pos, newp.number)
+        self.game.set_short_at_offset(self._slot_offsets[pos], newp.number)
         # Return the planet.
         return newp
 
 class Player(DataOffsetType):
     """A representation of players."""
+    __slots__ = ('game', 'offset', 'number')
     # Offset and block size.
     block_offset, block_size = 0x1aa0f, 0xea9
     max_players = 8
+    # The offset of each player's block in the file.
+    _OFFSETS = tuple(range(block_offset, block_offset+max_players*block_size,
+                           block_size))
     # Offsets of common data.  The names are rather interesting.  In
     # the file, they appear to have 0x14 bytes set aside for them, but
     # in the game they must be at most 14 bytes long.  An interesting
@@ -199,33 +294,25 @@ class Player(DataOffsetType):
     race_name_offset, race_name_size = 0x14, 14
 
     def __init__(self, game, number):
-        if number<0 or number>=game.numplayers:
+        # The count of players comes from the file, so also check it
+        # against the size of the offset table.
+        if number<0 or number>=min(game.numplayers, Player.max_players):
             raise ValueError(
                 "player number be nonnegative and less than number of players")
-        self.offset = Player.block_offset + number*Player.block_size
+        self.offset = Player._OFFSETS[number]
         self.number = number
         self.game = game
 
     def _getleadername(self):
         """The name of the leader."""
-        chars = []
-        d = self.game.data
-        for i in xrange(self.leader_name_size):
-            c = d[self.offset+self.leader_name_offset+i]
-            if not c: break
-            chars.append(chr(c))
-        return ''.join(chars)
+        return self.game.string_at_offset(
+            self.offset+self.leader_name_offset, self.leader_name_size)
     leader_name = property(_getleadername)
 
     def _getracename(self):
         """The name of the race."""
-        chars = []
-        d = self.game.data
-        for i in xrange(self.race_name_size):
-            c = d[self.offset+self.race_name_offset+i]
-            if not c: break
-            chars.append(chr(c))
-        return ''.join(chars)
+        return self.game.string_at_offset(
+            self.offset+self.race_name_offset, self.race_name_size)
     race_name = property(_getracename)
 
     def __str__(self):
@@ -235,6 +322,7 @@ class Player(DataOffsetType):
 
 class Colony(DataOffsetType):
     """A representation of colonies."""
+    __slots__ = ('game', 'offset', 'number')
     # The amount of the offset into the file where colonies start to appear.
     block_offset = 0x25d
     # The maximum number of colonies that a saved game file can
@@ -244,29 +332,34 @@ class Colony(DataOffsetType):
     max_colonies = 360
     # The size of the blocks for each colony.
     block_size = 0x169
+    # The offset of each colony's block in the file.
+    _OFFSETS = tuple(range(block_offset, block_offset+max_colonies*block_size,
+                           block_size))
 
     def __init__(self, game, number):
         if number < 0 or number >= self.max_colonies:
             raise ValueError("colony number must be in range 0 to %d"%(
                 Colony.max_colonies))
-        self.offset = Colony.block_offset + number*Colony.block_size
+        self.offset = Colony._OFFSETS[number]
         self.number = number
         self.game = game
 
     def _getplanet(self):
         """The planet this colony is on."""
         planetnum = self.game.short_at_offset(self.offset+2)
-        return Planet(self.game, planetnum) if planetnum != 0xffff else None
+        if planetnum == 0xffff: return None
+        return Planet.get(self.game, planetnum)
     planet = property(_getplanet)
 
     def _getplayer(self):
         """The player this colony belongs to."""
         pnum = self.game.data[self.offset+0x0]
-        return Player(self.game, pnum) if pnum != 0xff else None
+        return Player.get(self.game, pnum) if pnum != 0xff else None
     player = property(_getplayer)
 
 class Planet(DataOffsetType):
     """A representation of all planets in the system."""
+    __slots__ = ('game', 'offset', 'number')
     # The amount of the offset into the file where planets start to appear.
     block_offset = 0x162e9
     # The maximum number of planets that a saved game file can
@@ -275,30 +368,46 @@ class Planet(DataOffsetType):
     max_planets = 360
     # Mapping of type of body code to description.
     type2desc = {1:'asteroid', 2:'gas giant', 3:'planet'}
+    _desc2type = _reverse(type2desc)
     # Mapping of planet terraform to description.
     terraform2desc = ['toxic', 'radiated', 'barren', 'desert', 'tundra',
                       'ocean', 'swamp', 'arid', 'terran', 'gaia']
+    _desc2terraform = _reverse(terraform2desc)
     # Mapping of planet terraform to the typical food.
-    terraform2food = [0, 0, 0, 1, 1, 2, 2, 1, 2, 3]
+    terraform2food = bytes([0, 0, 0, 1, 1, 2, 2, 1, 2, 3])
     # Mapping of planet size code to the size description.
     size2desc = ['tiny', 'small', 'medium', 'large', 'huge']
+    _desc2size = _reverse(size2desc)
     # Mapping of planet size code to the *typical* byte in 0xd.
-    size2blockd = [2, 4, 5, 7, 10]
+    size2blockd = bytes([2, 4, 5, 7, 10])
     # Mapping of planet gravity to the gravity description.
     gravity2desc = ['LG', 'NG', 'HG']
+    _desc2gravity = _reverse(gravity2desc)
     # Mapping of planet richness to the richness description.
     richness2desc = ['ultra poor', 'poor', 'abundant', 'rich', 'ultra rich']
+    _desc2richness = _reverse(richness2desc)
     # Within the block, where are these things stored?
     block_size = 0x11
+    # The offset of each planet's block in the file.
+    _OFFSETS = tuple(range(block_offset, block_offset+max_planets*block_size,
+                           block_size))
 
     def __init__(self, game, number):
         if number < 0 or number >= self.max_planets:
             raise ValueError("planet number must be in range 0 to %d"%(
                 Planet.max_planets))
-        self.offset = Planet.block_offset + number*Planet.block_size
+        self.offset = Planet._OFFSETS[number]
         self.number = number
         self.game = game
 
+    def _snapshot(self):
+        """The fields of the planet block through byte 0xd, read at once.
+
+        The first item is the colony number, and the remainder are the
+        single byte fields starting from byte 2, so a byte k is at
+        index k-1."""
+        return _PLANET_FIELDS.unpack_from(self.game.data, self.offset)
+
     def _getcolonynum(self):
         """The index of the colony on this planet, or None if there is none."""
         colony_index = self.game.short_at_offset(self.offset)
@@ -308,8 +417,8 @@ class Planet(DataOffsetType):
     def _getcolony(self):
         """The colony on this planet, or None if there is none."""
         num = self.colonynum
-        if num==None: return None
-        return Colony(self.game, num)
+        if num is None: return None
+        return Colony.get(self.game, num)
     colony = property(_getcolony)
 
     def _getstarnum(self):
@@ -319,7 +428,7 @@ class Planet(DataOffsetType):
 
     def _getstar(self):
         """The star containing this planet."""
-        return Star(self.game, self.starnum)
+        return Star.get(self.game, self.starnum)
     star = property(_getstar, None, None, _getstar.__doc__)
 
     def _getposition(self):
@@ -345,8 +454,8 @@ class Planet(DataOffsetType):
         # Then swap planet positions as stored in the star.  We have
         # to do this even when there is no planet, as we need the
         # "blank" spot to have 0xffff.
-        aoffset = self.star.offset+Star.planet_offset+2*pos
-        boffset = self.star.offset+Star.planet_offset+2*oldpos
+        aoffset = self.star._slot_offsets[pos]
+        boffset = self.star._slot_offsets[oldpos]
         d = self.game.data
         d[aoffset], d[aoffset+1], d[boffset], d[boffset+1] = (
             d[boffset], d[boffset+1], d[aoffset], d[aoffset+1])
@@ -370,10 +479,12 @@ class Planet(DataOffsetType):
         """The string of the type of body (asteroid, gas gaint, planet)."""
         return Planet.type2desc.get(self.type, None)
     def _settype_str(self, value):
-        self.type = dict((v,k) for k,v in Planet.type2desc.items())[value]
+        try:
+            self.type = Planet._desc2type[value]
+        except KeyError:
+            raise ValueError("type_str must be one of %s"%(
+                ','.join(Planet.type2desc.values())))
     type_str = property(_gettype_str, _settype_str, None, _gettype_str.__doc__)
-        
-    type = property(_gettype, None, None, _gettype.__doc__)
 
     # TERRAFORM
 
@@ -399,8 +510,8 @@ class Planet(DataOffsetType):
         return Planet.terraform2desc[self.terraform]
     def _setterraform_str(self, value):
         try:
-            self.terraform = Planet.terraform2desc.index(value)
-        except ValueError:
+            self.terraform = Planet._desc2terraform[value]
+        except KeyError:
             raise ValueError("terraform_str must be one of %s"%(
                 ','.join(Planet.terraform2desc)))
     terraform_str = property(_getterraform_str, _setterraform_str,
@@ -430,8 +541,8 @@ class Planet(DataOffsetType):
             return None
     def _setsize_str(self, value):
         try:
-            self.size = Planet.size2desc.index(value)
-        except ValueError:
+            self.size = Planet._desc2size[value]
+        except KeyError:
             raise ValueError("size_str must be one of %s"%(
                 ','.join(Planet.size2desc)))
     size_str = property(_getsize_str, _setsize_str, None, _getsize_str.__doc__)
@@ -471,8 +582,8 @@ class Planet(DataOffsetType):
             return None
     def _setgravity_str(self, value):
         try:
-            self.gravity = Planet.gravity2desc.index(value)
-        except ValueError:
+            self.gravity = Planet._desc2gravity[value]
+        except KeyError:
             raise ValueError("gravity_str must be one of %s"%(
                 ','.join(Planet.gravity2desc)))
     gravity_str = property(_getgravity_str, _setgravity_str,
@@ -497,21 +608,26 @@ class Planet(DataOffsetType):
             return None
     def _setrichness_str(self, value):
         try:
-            self.richness = Planet.richness2desc.index(value)
-        except ValueError:
+            self.richness = Planet._desc2richness[value]
+        except KeyError:
             raise ValueError("richness_str must be one of %s"%(
                 ','.join(Planet.richness2desc)))
     richness_str = property(_getrichness_str, _setrichness_str,
                             None, _getrichness_str.__doc__)
 
     def __str__(self):
+        # Bytes 4 through 0xa: type, size, gravity, unknown byte 7,
+        # terraform, scenery, richness.
+        btype, size, gravity, _, terraform, _, richness = \
+               self._snapshot()[3:10]
         tokens = ['planet-%03d' % (self.number)]
-        if self.type_str=='planet':
-            tokens.extend((self.size_str, self.richness_str,
-                           self.terraform_str))
-            if self.gravity != 1: tokens.append(self.gravity_str)
+        if btype==3:
+            tokens.extend((Planet.size2desc[size],
+                           Planet.richness2desc[richness],
+                           Planet.terraform2desc[terraform]))
+            if gravity != 1: tokens.append(Planet.gravity2desc[gravity])
         else:
-            tokens.append(self.type_str)
+            tokens.append(Planet.type2desc.get(btype, None))
         return '<'+' '.join(tokens)+'>'
 
     # SCENERY
@@ -533,7 +649,7 @@ if __name__ == '__main__':
 
     def idealize(starsystem):
         # Make the star system better.
-        for p in starsystem.planets():
+        for p in starsystem.planets_list():
             p.richness = max(
                 p.richness, 3 if p.colony else random.randint(2,4))
             p.size = max(p.size, 3)
@@ -542,11 +658,12 @@ if __name__ == '__main__':
             if p.terraform == 0:
                 p.terraform = 1
         # Fill in the remainder with planets.
-        used_positions = set(p.position for p in starsystem.planets())
-        for pos in xrange(5):
-            if pos in used_positions:
+        used = starsystem.occupied_positions()
+        for pos in range(5):
+            if used >> pos & 1:
                 continue
-            p = starsystem.make_planet(pos)
+            p = starsystem._make_planet_unchecked(pos)
+            used |= 1 << pos
             p.size = random.randint(3,4)
             p.richness = random.randint(2,4)
             if p.size + p.richness > 5:
@@ -555,20 +672,20 @@ if __name__ == '__main__':
 
     def orionize():
         starsystem = g.star('Orion')
-        used_positions = set(p.position for p in starsystem.planets())
-        for pos in xrange(5):
-            if pos not in used_positions:
-                p = starsystem.make_planet(pos, 1)
+        used = starsystem.occupied_positions()
+        for pos in range(5):
+            if not used >> pos & 1:
+                p = starsystem._make_planet_unchecked(pos, 1)
     
     import sys
     gameno = int(sys.argv[1]) if len(sys.argv)>=2 else 4
     p = '/Users/thomas/Documents/DosBox/CDrive/Moo2/MPS/ORION2/SAVE%d.GAM' % (
         gameno)
-    print 'Reading game number %d' % gameno
+    print('Reading game number %d' % gameno)
     g = Game(p)
 
     for p in g.players():
-        print p
+        print(p)
 
     cry = g.star('Cryslon')
     idealize(cry)